@@ -5,40 +5,108 @@ A simple CLI tool for performing Google dork searches and extracting first lines
 """
 
 import argparse
+import asyncio
+import functools
+import json
 import sys
 import os
-import yaml
-import requests
 import re
-from typing import List, Dict, Optional
-from googleapiclient.discovery import build
-from colorama import Fore, Style, init
+from io import BytesIO
+from typing import Iterator, List, Dict, Optional, Tuple
 
-# Initialize colorama for colored output
-init(autoreset=True)
+# yaml, requests, httpx, and googleapiclient are imported lazily at the
+# point of use; together they cost hundreds of ms that even `dorker --help`
+# would otherwise pay
+
+# Plain ANSI codes instead of colorama: no import cost, and codes are only
+# emitted when stdout is a terminal and NO_COLOR is unset
+_USE_COLOR = sys.stdout.isatty() and os.environ.get('NO_COLOR') is None
+C_RED = '\x1b[31m' if _USE_COLOR else ''
+C_GREEN = '\x1b[32m' if _USE_COLOR else ''
+C_YELLOW = '\x1b[33m' if _USE_COLOR else ''
+C_CYAN = '\x1b[36m' if _USE_COLOR else ''
+C_WHITE = '\x1b[37m' if _USE_COLOR else ''
+C_RESET = '\x1b[0m' if _USE_COLOR else ''
+
+# Compiled once at import; these run on every fetched result
+_WS_RE = re.compile(r'\s+')
+_LINE_RE = re.compile(r'[^\n]{6,}')
+
+# Dork operators to drop from queries; str.startswith with a tuple is a
+# single C-level multi-prefix check
+_OPERATORS = ('site:', 'ext:', 'inurl:', 'intitle:', 'intext:', 'filetype:', 'cache:', 'link:')
+
+# Only the first matching line is ever shown, so cap how much body we pull
+_BODY_CAP = 262144  # 256 KiB
+
+# Ask servers for just the document head; most keyword hits live in the
+# first few KB (title, meta, opening text). Servers that ignore Range
+# return 200 with the full body, which the _BODY_CAP read still bounds
+_RANGE_HEADER = 'bytes=0-32767'
+
+# PDF/binary junk bytes to delete before decoding (tab/newline/CR survive);
+# bytes.translate walks the buffer once in C instead of a regex class scan
+_JUNK_BYTES = bytes(b for b in range(256)
+                    if b < 0x09 or b in (0x0B, 0x0C) or 0x0E <= b <= 0x1F or b >= 0x7F)
+
+# Script/style blocks first, then any remaining tag
+_TAG_RE = re.compile(r'<(?:script|style)\b.*?</(?:script|style)\s*>|<[^>]*>',
+                     re.IGNORECASE | re.DOTALL)
+
+
+def _pdf_to_text(raw: bytes) -> Optional[str]:
+    """Extract text from the first page of a PDF; None if pdfminer is
+    unavailable or the (possibly truncated) document cannot be parsed."""
+    try:
+        from pdfminer.high_level import extract_text
+    except ImportError:
+        return None
+    try:
+        return extract_text(BytesIO(raw), maxpages=1)
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_data(config_file: str, mtime: float) -> Dict:
+    """Parse the config file; memoized on (path, mtime) so repeated
+    instantiation only parses once per file change."""
+    if config_file.endswith('.json'):
+        with open(config_file, 'rb') as f:
+            return json.load(f)
+    import yaml
+    with open(config_file, 'r') as f:
+        # CSafeLoader binds to libyaml's C parser when available
+        return yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
 
 
 class DorkerConfig:
     """Handle configuration loading from YAML file."""
-    
+
     def __init__(self, config_file: str = "config.yaml"):
         self.config_file = config_file
         self.credentials = []
         self.load_config()
-    
+
     def load_config(self):
         """Load API keys and search engine IDs from config file."""
-        if not os.path.exists(self.config_file):
-            print(f"{Fore.RED}[ERROR] Config file not found: {self.config_file}")
+        config_file = self.config_file
+        # Prefer a sibling JSON config when one exists; json.load is far
+        # faster than YAML parsing at every CLI startup
+        json_sibling = os.path.splitext(config_file)[0] + '.json'
+        if not config_file.endswith('.json') and os.path.exists(json_sibling):
+            config_file = json_sibling
+
+        if not os.path.exists(config_file):
+            print(f"{C_RED}[ERROR] Config file not found: {config_file}{C_RESET}")
             sys.exit(1)
-        
+
         try:
-            with open(self.config_file, 'r') as f:
-                config = yaml.safe_load(f)
-                self.credentials = config.get('google', [])
-                print(f"{Fore.GREEN}[+] Loaded {len(self.credentials)} API credentials")
+            config = _load_config_data(config_file, os.stat(config_file).st_mtime)
+            self.credentials = config.get('google', [])
+            print(f"{C_GREEN}[+] Loaded {len(self.credentials)} API credentials{C_RESET}")
         except Exception as e:
-            print(f"{Fore.RED}[ERROR] Failed to load config: {e}")
+            print(f"{C_RED}[ERROR] Failed to load config: {e}{C_RESET}")
             sys.exit(1)
     
     def get_credentials(self, index: int = 0) -> Optional[Dict]:
@@ -55,66 +123,111 @@ class GoogleDorker:
         self.config = config
         self.verbose = verbose
         self.results = []
+        self._kw_re = None
+        # Memoized CSE client; discovery.build is too slow to rerun per query
+        self._cse = None
+        # Bodies of already-fetched URLs; duplicate results share one fetch
+        self._page_cache = {}
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+        # Pooled session for the sync fetch path; reusing connections
+        # amortizes TCP/TLS handshakes when results share a host
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=Retry(total=0))
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)',
+                                      'Range': _RANGE_HEADER})
     
     def search(self, query: str, max_results: int = 10) -> List[Dict]:
         """
         Perform a Google search using the dork query.
-        
+
         Args:
             query: The dork query to search for
             max_results: Maximum number of results to retrieve
-        
+
         Returns:
             List of results with URL and first line content matching keywords
         """
+        self.results.extend(self.search_iter(query, max_results))
+        return self.results
+
+    def search_iter(self, query: str, max_results: int = 10) -> Iterator[Dict]:
+        """
+        Perform a Google search and yield results one at a time.
+
+        Args:
+            query: The dork query to search for
+            max_results: Maximum number of results to retrieve
+
+        Yields:
+            Results with URL and first line content matching keywords
+        """
         credentials = self.config.get_credentials(0)
         if not credentials:
-            print(f"{Fore.RED}[ERROR] No credentials available")
-            return []
-        
+            print(f"{C_RED}[ERROR] No credentials available{C_RESET}")
+            return
+
         api_key = credentials.get('api_key')
         search_engine_id = credentials.get('search_engine_id')
         
         # Extract keywords from query (words that are not dork operators)
         keywords = self._extract_keywords(query)
+        # One compiled alternation scans each line once for any keyword
+        self._kw_re = re.compile('|'.join(re.escape(k) for k in keywords), re.IGNORECASE)
         
         if self.verbose:
-            print(f"{Fore.CYAN}[*] Starting search with query: {query}")
-            print(f"{Fore.CYAN}[*] Keywords to match: {keywords}")
-            print(f"{Fore.CYAN}[*] Using Search Engine ID: {search_engine_id[:10]}...")
+            sys.stdout.write(f"{C_CYAN}[*] Starting search with query: {query}\n"
+                             f"[*] Keywords to match: {keywords}\n"
+                             f"[*] Using Search Engine ID: {search_engine_id[:10]}...{C_RESET}\n")
         
         try:
-            service = build("customsearch", "v1", developerKey=api_key)
-            request = service.cse().list(q=query, cx=search_engine_id, num=min(10, max_results))
+            if self._cse is None:
+                from googleapiclient.discovery import build
+                # static_discovery skips the round-trip to Google's
+                # discovery server; the client is reused across searches
+                self._cse = build("customsearch", "v1", developerKey=api_key,
+                                  cache_discovery=False, static_discovery=True).cse()
+            # Only link/title/snippet are ever read, so have the API return
+            # just those; less JSON to transfer and decode per query
+            request = self._cse.list(q=query, cx=search_engine_id, num=min(10, max_results),
+                                     fields='items(link,title,snippet)')
             response = request.execute()
             
             items = response.get('items', [])
             if self.verbose:
-                print(f"{Fore.GREEN}[+] Found {len(items)} results")
-            
-            # Extract URLs and first lines matching keywords
-            for item in items:
-                url = item.get('link', '')
-                title = item.get('title', '')
-                snippet = item.get('snippet', '')
-                
+                print(f"{C_GREEN}[+] Found {len(items)} results{C_RESET}")
+
+            # Fetch all result pages concurrently, then extract matching lines
+            try:
+                import httpx  # noqa: F401
+            except ImportError:
+                httpx = None
+            if httpx is not None:
+                first_lines = asyncio.run(self._fetch_all(items))
+            else:
+                first_lines = self._fetch_all_sync(items)
+
+            for item, first_line in zip(items, first_lines):
                 result = {
-                    'url': url,
-                    'title': title,
-                    'snippet': snippet,
-                    'first_line': self._extract_first_line(url, snippet, keywords)
+                    'url': item.get('link', ''),
+                    'title': item.get('title', ''),
+                    'snippet': item.get('snippet', ''),
+                    'first_line': first_line
                 }
-                self.results.append(result)
-                
+
                 if self.verbose:
-                    print(f"{Fore.YELLOW}[URL] {url}")
-                    print(f"{Fore.WHITE}      Matching line: {result['first_line'][:100]}...")
-            
-            return self.results
-        
+                    sys.stdout.write(
+                        f"{C_YELLOW}[URL] {result['url']}{C_RESET}\n"
+                        f"{C_WHITE}      Matching line: {result['first_line'][:100]}...{C_RESET}\n")
+
+                yield result
+
         except Exception as e:
-            print(f"{Fore.RED}[ERROR] Search failed: {e}")
-            return []
+            print(f"{C_RED}[ERROR] Search failed: {e}{C_RESET}")
+        finally:
+            self._session.close()
     
     def _extract_keywords(self, query: str) -> List[str]:
         """
@@ -126,87 +239,237 @@ class GoogleDorker:
         Returns:
             List of keywords to search for
         """
-        # Remove common dork operators and their values
-        operators = ['site:', 'ext:', 'inurl:', 'intitle:', 'intext:', 'filetype:', 'cache:', 'link:']
-        
-        # Split query and filter out operator parts
+        # Split query and filter out dork operator parts
         keywords = []
-        parts = query.split()
-        
-        for part in parts:
-            # Skip if part starts with an operator
-            is_operator = False
-            for op in operators:
-                if part.lower().startswith(op):
-                    is_operator = True
-                    break
-            
+        for part in query.split():
+            if part.lower().startswith(_OPERATORS):
+                continue
             # If not an operator, treat it as a keyword
-            if not is_operator and part.strip('"\''):
-                keywords.append(part.strip('"\''))
-        
+            stripped = part.strip('"\'')
+            if stripped:
+                keywords.append(stripped)
+
         return keywords if keywords else ['']
     
-    def _extract_first_line(self, url: str, snippet: str = "", keywords: List[str] = None) -> str:
+    async def _fetch(self, client: 'httpx.AsyncClient', url: str) -> Tuple[str, bytes]:
         """
-        Extract the first line that matches keywords from URL content.
-        
+        Fetch the body of a single URL with a hard timeout.
+
         Args:
+            client: Shared httpx async client
             url: The URL to fetch content from
-            snippet: Fallback snippet if fetching fails
-            keywords: List of keywords to search for in the content
-        
+
         Returns:
-            First line containing a keyword or first line of content
+            The Content-Type header and raw response body
+        """
+        async with self._fetch_sem:
+            async with client.stream('GET', url) as response:
+                response.raise_for_status()
+                # Read at most _BODY_CAP bytes instead of the full body
+                raw = b''
+                async for chunk in response.aiter_bytes():
+                    raw += chunk
+                    if len(raw) >= _BODY_CAP:
+                        break
+                return response.headers.get('Content-Type', ''), raw[:_BODY_CAP]
+
+    async def _fetch_all(self, items: List[Dict]) -> List[str]:
         """
+        Fetch all result URLs concurrently and extract matching lines.
+
+        Args:
+            items: Search result items from the CSE response
+
+        Returns:
+            One extracted first line per item, in item order
+        """
+        import httpx
+
+        self._fetch_sem = asyncio.Semaphore(20)
+        # Results whose snippet already matches need no fetch at all;
+        # fetch each remaining distinct, uncached URL exactly once
+        snippet_lines = [self._snippet_match(item.get('snippet', '')) for item in items]
+        pending = [url for url in dict.fromkeys(
+                       item.get('link', '')
+                       for item, line in zip(items, snippet_lines) if line is None)
+                   if url not in self._page_cache]
+        if pending:
+            # HTTP/2 multiplexes every same-host URL over one connection,
+            # so repeat hosts cost one handshake instead of one each
+            limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+            async with httpx.AsyncClient(
+                    http2=True, timeout=5.0, limits=limits, verify=False,
+                    follow_redirects=True,
+                    headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)',
+                             'Range': _RANGE_HEADER}) as client:
+                tasks = [self._fetch(client, url) for url in pending]
+                bodies = await asyncio.gather(*tasks, return_exceptions=True)
+            self._page_cache.update(zip(pending, bodies))
+
+        return [line if line is not None
+                else self._first_line_for_item(item, self._page_cache[item.get('link', '')])
+                for item, line in zip(items, snippet_lines)]
+
+    def _fetch_sync(self, url: str) -> Tuple[str, bytes]:
+        """
+        Fetch the body of a single URL through the pooled session.
+
+        Args:
+            url: The URL to fetch content from
+
+        Returns:
+            The Content-Type header and raw response body
+        """
+        response = self._session.get(url, timeout=5, stream=True)
         try:
-            # Try to fetch the content from the URL
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
-            response = requests.get(url, headers=headers, timeout=5)
             response.raise_for_status()
-            
-            content = response.text
-            
-            # Try to decode PDF or binary content
+            # Read at most _BODY_CAP bytes instead of the full body
+            raw = response.raw.read(_BODY_CAP, decode_content=True)
+            return response.headers.get('Content-Type', ''), raw
+        finally:
+            response.close()
+
+    def _fetch_all_sync(self, items: List[Dict]) -> List[str]:
+        """
+        Threaded fetch fallback used when httpx is not installed.
+
+        Args:
+            items: Search result items from the CSE response
+
+        Returns:
+            One extracted first line per item, in item order
+        """
+        import requests
+        from concurrent.futures import ThreadPoolExecutor
+
+        def fetch(url):
             try:
-                # Remove common PDF/binary junk characters
-                content = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F-\xFF]+', ' ', content)
-                content = re.sub(r'\s+', ' ', content)  # Normalize whitespace
-            except:
-                pass
-            
-            # Split into lines
-            lines = content.split('\n')
-            
-            # If keywords provided, find lines matching them
-            if keywords:
-                for line in lines:
-                    cleaned = line.strip()
-                    if cleaned and len(cleaned) > 5:
-                        # Check if any keyword matches (case-insensitive)
-                        for keyword in keywords:
-                            if keyword.lower() in cleaned.lower():
-                                # Clean up the line for display
-                                cleaned = re.sub(r'\s+', ' ', cleaned)
-                                return cleaned[:200]
-            
+                return self._fetch_sync(url)
+            except requests.RequestException as e:
+                return e
+
+        # Results whose snippet already matches need no fetch at all; fetch
+        # each remaining distinct, uncached URL exactly once — requests
+        # releases the GIL during I/O, so threads overlap per-URL latencies
+        snippet_lines = [self._snippet_match(item.get('snippet', '')) for item in items]
+        pending = [url for url in dict.fromkeys(
+                       item.get('link', '')
+                       for item, line in zip(items, snippet_lines) if line is None)
+                   if url not in self._page_cache]
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(16, len(pending))) as executor:
+                self._page_cache.update(zip(pending, executor.map(fetch, pending)))
+
+        return [line if line is not None
+                else self._first_line_for_item(item, self._page_cache[item.get('link', '')])
+                for item, line in zip(items, snippet_lines)]
+
+    def _snippet_match(self, snippet: str) -> Optional[str]:
+        """
+        Return the cleaned snippet when it already contains a keyword.
+
+        Google highlights query terms in snippets, so for most dorks the
+        answer is in hand before any page fetch.
+
+        Args:
+            snippet: The snippet Google returned for the result
+
+        Returns:
+            The cleaned snippet on a keyword hit, else None
+        """
+        # An empty pattern (operator-only query) would match everything and
+        # suppress fetching entirely, so require a real keyword
+        if snippet and self._kw_re is not None and self._kw_re.pattern \
+                and self._kw_re.search(snippet):
+            return _WS_RE.sub(' ', snippet)[:200]
+        return None
+
+    def _first_line_for_item(self, item: Dict, body) -> str:
+        """
+        Turn a fetched body (or fetch error) into the displayed first line.
+
+        Args:
+            item: The search result item the body belongs to
+            body: The (content type, raw page bytes) pair, or the exception
+                raised fetching it
+
+        Returns:
+            First line containing a keyword, or the snippet as fallback
+        """
+        snippet = item.get('snippet', '')
+        if isinstance(body, Exception):
+            # Use snippet as fallback
+            if self.verbose:
+                url = item.get('link', '')
+                print(f"{C_YELLOW}[!] Could not fetch content from {url}: {str(body)[:50]}{C_RESET}")
+            return snippet[:150] if snippet else "Failed to extract content"
+        content_type, raw = body
+        return self._extract_first_line_from_text(raw, snippet, content_type)
+
+    def _extract_first_line_from_text(self, content: bytes, snippet: str = "",
+                                      content_type: str = "") -> str:
+        """
+        Extract the first line matching the compiled keyword pattern.
+
+        Args:
+            content: The raw fetched page bytes
+            snippet: Fallback snippet if nothing matches
+            content_type: The response Content-Type, used to pick the parser
+
+        Returns:
+            First line containing a keyword or first line of content
+        """
+        try:
+            content_type = content_type.lower()
+            if 'pdf' in content_type or content[:5] == b'%PDF-':
+                # Real text extraction beats scanning PDF stream structure;
+                # fall back to the byte-strip path if pdfminer is missing
+                # or the truncated document will not parse
+                text = _pdf_to_text(content)
+                if text is not None:
+                    content = text
+                else:
+                    content = content.translate(None, _JUNK_BYTES).decode('utf-8', errors='replace')
+            else:
+                # Delete common binary junk bytes (newlines survive, so line
+                # boundaries still exist below), then decode; stripping first
+                # also avoids decode errors on binary content
+                content = content.translate(None, _JUNK_BYTES).decode('utf-8', errors='replace')
+                if 'html' in content_type:
+                    # Drop script/style blocks and markup so keyword lines
+                    # come from visible text
+                    content = _TAG_RE.sub(' ', content)
+
+            # Find the first keyword hit with one search over the whole
+            # buffer (the scan stays inside the C regex engine), then
+            # recover the enclosing line from the match position
+            if self._kw_re is not None:
+                pos = 0
+                while True:
+                    hit = self._kw_re.search(content, pos)
+                    if hit is None:
+                        break
+                    start = content.rfind('\n', 0, hit.start()) + 1
+                    end = content.find('\n', hit.end())
+                    if end == -1:
+                        end = len(content)
+                    cleaned = content[start:end].strip()
+                    if len(cleaned) > 5:
+                        # Clean up the line for display
+                        return _WS_RE.sub(' ', cleaned)[:200]
+                    pos = end + 1
+
             # Fallback: return first non-empty line with meaningful content
-            for line in lines:
-                cleaned = line.strip()
+            for match in _LINE_RE.finditer(content):
+                cleaned = match.group(0).strip()
                 # Skip PDF headers and binary data
-                if cleaned and len(cleaned) > 10 and not cleaned.startswith('%PDF'):
+                if len(cleaned) > 10 and not cleaned.startswith('%PDF'):
                     # Clean up the line
-                    cleaned = re.sub(r'\s+', ' ', cleaned)
-                    return cleaned[:200]
-            
+                    return _WS_RE.sub(' ', cleaned)[:200]
+
             # Fallback to snippet
             return snippet[:150] if snippet else "No content extracted"
-        
-        except requests.RequestException as e:
-            # Use snippet as fallback
-            if self.verbose:
-                print(f"{Fore.YELLOW}[!] Could not fetch content from {url}: {str(e)[:50]}")
-            return snippet[:150] if snippet else "Failed to extract content"
+
         except Exception as e:
             return f"Error: {str(e)[:100]}"
 
@@ -215,7 +478,6 @@ class DorkerCLI:
     """Command-line interface for Dorker."""
     
     def __init__(self):
-        self.config = DorkerConfig()
         self.parser = self._build_parser()
     
     def _build_parser(self) -> argparse.ArgumentParser:
@@ -275,36 +537,39 @@ Examples:
         verbose = parsed_args.verbose and not parsed_args.quiet
         
         if verbose:
-            print(f"{Fore.CYAN}{'='*60}")
-            print(f"{Fore.CYAN}Dorker - Google Dorking Search Tool")
-            print(f"{Fore.CYAN}{'='*60}")
+            sys.stdout.write(f"{C_CYAN}{'='*60}\n"
+                             f"Dorker - Google Dorking Search Tool\n"
+                             f"{'='*60}{C_RESET}\n")
         
-        # Perform search
+        # Config is loaded only once the arguments have parsed, so --help
+        # never touches the config file or the heavy imports
+        self.config = DorkerConfig()
+
+        # Perform search, streaming each result to disk as it arrives
         dorker = GoogleDorker(self.config, verbose=verbose)
-        results = dorker.search(parsed_args.query, max_results=parsed_args.max)
-        
-        if not results:
-            print(f"{Fore.RED}[ERROR] No results found")
-            return 1
-        
-        # Save results to file
+        total = 0
         try:
-            with open(parsed_args.output, 'w', encoding='utf-8') as f:
-                for result in results:
+            with open(parsed_args.output, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                for result in dorker.search_iter(parsed_args.query, max_results=parsed_args.max):
                     f.write(f"URL: {result['url']}\n")
                     f.write(f"First Line: {result['first_line']}\n")
                     f.write(f"Snippet: {result['snippet']}\n")
                     f.write("-" * 80 + "\n\n")
-            
-            if verbose:
-                print(f"\n{Fore.GREEN}[+] Results saved to: {parsed_args.output}")
-                print(f"{Fore.GREEN}[+] Total results: {len(results)}")
-                print(f"{Fore.CYAN}{'='*60}\n")
-        
+                    total += 1
+
         except IOError as e:
-            print(f"{Fore.RED}[ERROR] Failed to write to output file: {e}")
+            print(f"{C_RED}[ERROR] Failed to write to output file: {e}{C_RESET}")
             return 1
-        
+
+        if not total:
+            print(f"{C_RED}[ERROR] No results found{C_RESET}")
+            return 1
+
+        if verbose:
+            sys.stdout.write(f"\n{C_GREEN}[+] Results saved to: {parsed_args.output}\n"
+                             f"[+] Total results: {total}{C_RESET}\n"
+                             f"{C_CYAN}{'='*60}{C_RESET}\n\n")
+
         return 0
 
 